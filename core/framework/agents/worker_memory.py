@@ -141,18 +141,20 @@ def _build_run_context(
         EventType.CONSTRAINT_VIOLATION: "constraint violation",
         EventType.NODE_RETRY: "retry",
     }
+    # One pass over the events instead of one per issue type
+    type_counts = Counter(e.type for e in events_chron)
     issue_parts: list[str] = []
     for evt_type, label in issue_map.items():
-        n = sum(1 for e in events_chron if e.type == evt_type)
+        n = type_counts[evt_type]
         if n:
             issue_parts.append(f"{n} {label}(s)")
     if issue_parts:
         lines.append(f"Issues: {', '.join(issue_parts)}")
 
     # Escalations to queen
-    escalations = [e for e in events_chron if e.type == EventType.ESCALATION_REQUESTED]
+    escalations = type_counts[EventType.ESCALATION_REQUESTED]
     if escalations:
-        lines.append(f"Escalations to queen: {len(escalations)}")
+        lines.append(f"Escalations to queen: {escalations}")
 
     # Final LLM output snippet (last LLM_TEXT_DELTA snapshot)
     text_events = [e for e in reversed(events_chron) if e.type == EventType.LLM_TEXT_DELTA]
@@ -112,6 +112,9 @@ class TriggerEvent:
     re.IGNORECASE,
 )
 
+# Spillover files written by conversation compaction (conversation_<n>.md).
+_CONVERSATION_FILE_RE = re.compile(r"conversation_\d+\.md$")
+
 
 def _is_context_too_large_error(exc: BaseException) -> bool:
     """Detect whether an exception indicates the LLM input was too large."""
@@ -4652,8 +4655,11 @@ def _build_emergency_summary(
                         f.name for f in data_dir.iterdir() if f.is_file() and f.name != "adapt.md"
                     )
                     # Separate conversation history files from regular data files
-                    conv_files = [f for f in all_files if re.match(r"conversation_\d+\.md$", f)]
-                    data_files = [f for f in all_files if f not in conv_files]
+                    # in one pass (no list-membership rescans).
+                    conv_files: list[str] = []
+                    data_files: list[str] = []
+                    for f in all_files:
+                        (conv_files if _CONVERSATION_FILE_RE.match(f) else data_files).append(f)
 
                     if conv_files:
                         conv_list = "\n".join(
@@ -11,6 +11,7 @@
 import json
 import logging
 import os
+from collections import deque
 from collections.abc import Awaitable, Callable
 from dataclasses import dataclass, field
 from datetime import datetime
@@ -255,7 +256,8 @@ def __init__(
             max_concurrent_handlers: Maximum concurrent handler executions
         """
         self._subscriptions: dict[str, Subscription] = {}
-        self._event_history: list[AgentEvent] = []
+        # Bounded ring buffer: appends evict the oldest event in O(1)
+        self._event_history: deque[AgentEvent] = deque(maxlen=max_history)
         self._max_history = max_history
         self._semaphore = asyncio.Semaphore(max_concurrent_handlers)
         self._subscription_counter = 0
@@ -463,8 +465,6 @@ async def publish(self, event: AgentEvent) -> None:
         # Add to history
         async with self._lock:
             self._event_history.append(event)
-            if len(self._event_history) > self._max_history:
-                self._event_history = self._event_history[-self._max_history :]
 
         # Write event to JSONL file (gated by HIVE_DEBUG_EVENTS env var)
         if _DEBUG_EVENTS_ENABLED:
@@ -1263,17 +1263,22 @@ def get_history(
         Returns:
             List of matching events (most recent first)
         """
-        events = self._event_history[::-1]  # Reverse for most recent first
-
-        # Apply filters
-        if event_type:
-            events = [e for e in events if e.type == event_type]
-        if stream_id:
-            events = [e for e in events if e.stream_id == stream_id]
-        if execution_id:
-            events = [e for e in events if e.execution_id == execution_id]
-
-        return events[:limit]
+        # Walk newest-first and stop at the limit instead of copying and
+        # filtering the whole history (most callers ask for limit=1).
+        events: list[AgentEvent] = []
+        if limit <= 0:
+            return events
+        for e in reversed(self._event_history):
+            if event_type and e.type != event_type:
+                continue
+            if stream_id and e.stream_id != stream_id:
+                continue
+            if execution_id and e.execution_id != execution_id:
+                continue
+            events.append(e)
+            if len(events) >= limit:
+                break
+        return events
 
     def get_stats(self) -> dict:
         """Get event bus statistics."""
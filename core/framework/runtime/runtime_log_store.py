@@ -24,6 +24,7 @@
 from __future__ import annotations
 
 import asyncio
+import heapq
 import json
 import logging
 from datetime import UTC, datetime
@@ -169,21 +170,11 @@ async def list_runs(
         Directories without summary.json are treated as in-progress runs and
         get a synthetic summary with status="in_progress".
         """
-        entries = await asyncio.to_thread(self._scan_run_dirs)
+        # One worker-thread hop for the whole scan instead of one per run
+        all_summaries = await asyncio.to_thread(self._load_all_summaries)
         summaries: list[RunSummaryLog] = []
 
-        for run_id in entries:
-            summary = await self.load_summary(run_id)
-            if summary is None:
-                # In-progress run: no summary.json yet. Synthesize one.
-                run_dir = self._get_run_dir(run_id)
-                if not run_dir.is_dir():
-                    continue
-                summary = RunSummaryLog(
-                    run_id=run_id,
-                    status="in_progress",
-                    started_at=_infer_started_at(run_id),
-                )
+        for summary in all_summaries:
             if status and status != "needs_attention" and summary.status != status:
                 continue
             if status == "needs_attention" and not summary.needs_attention:
@@ -192,14 +183,37 @@ async def list_runs(
                 continue
             summaries.append(summary)
 
-        # Sort by started_at descending (most recent first)
-        summaries.sort(key=lambda s: s.started_at, reverse=True)
-        return summaries[:limit]
+        # Most recent first; partial sort since only `limit` are returned
+        return heapq.nlargest(limit, summaries, key=lambda s: s.started_at)
 
     # -------------------------------------------------------------------
     # Internal helpers
     # -------------------------------------------------------------------
 
+    def _load_all_summaries(self) -> list[RunSummaryLog]:
+        """Load every run's summary synchronously (called via to_thread).
+
+        Runs without summary.json get a synthetic in-progress summary.
+        """
+        summaries: list[RunSummaryLog] = []
+        for run_id in self._scan_run_dirs():
+            run_dir = self._get_run_dir(run_id)
+            data = self._read_json_sync(run_dir / "summary.json")
+            if data is not None:
+                summaries.append(RunSummaryLog(**data))
+                continue
+            # In-progress run: no summary.json yet. Synthesize one.
+            if not run_dir.is_dir():
+                continue
+            summaries.append(
+                RunSummaryLog(
+                    run_id=run_id,
+                    status="in_progress",
+                    started_at=_infer_started_at(run_id),
+                )
+            )
+        return summaries
+
     def _scan_run_dirs(self) -> list[str]:
         """Return list of run_id directory names from both old and new locations.
 
@@ -257,17 +271,18 @@ def _write() -> None:
     @staticmethod
     async def _read_json(path: Path) -> dict | None:
         """Read and parse a JSON file. Returns None if missing or corrupt."""
+        return await asyncio.to_thread(RuntimeLogStore._read_json_sync, path)
 
-        def _read() -> dict | None:
-            if not path.exists():
-                return None
-            try:
-                return json.loads(path.read_text(encoding="utf-8"))
-            except (json.JSONDecodeError, OSError) as e:
-                logger.warning("Failed to read %s: %s", path, e)
-                return None
-
-        return await asyncio.to_thread(_read)
+    @staticmethod
+    def _read_json_sync(path: Path) -> dict | None:
+        """Blocking body of _read_json."""
+        if not path.exists():
+            return None
+        try:
+            return json.loads(path.read_text(encoding="utf-8"))
+        except (json.JSONDecodeError, OSError) as e:
+            logger.warning("Failed to read %s: %s", path, e)
+            return None
 
 
 # -------------------------------------------------------------------
@@ -8,8 +8,10 @@
 """
 
 import asyncio
+import itertools
 import logging
 import time
+from collections import deque
 from dataclasses import dataclass, field
 from enum import StrEnum
 from typing import Any
@@ -86,9 +88,9 @@ def __init__(self):
         self._stream_locks: dict[str, asyncio.Lock] = {}
         self._key_locks: dict[str, asyncio.Lock] = {}
 
-        # Change history for debugging/auditing
-        self._change_history: list[StateChange] = []
+        # Change history for debugging/auditing (oldest evicted on append)
         self._max_history = 1000
+        self._change_history: deque[StateChange] = deque(maxlen=self._max_history)
 
         # Version tracking
         self._version = 0
@@ -281,10 +283,6 @@ def _record_change(self, change: StateChange) -> None:
         """Record a state change for auditing."""
         self._change_history.append(change)
 
-        # Trim history if too long
-        if len(self._change_history) > self._max_history:
-            self._change_history = self._change_history[-self._max_history :]
-
     # === BULK OPERATIONS ===
 
     async def read_all(
@@ -340,7 +338,10 @@ def get_stats(self) -> dict:
 
     def get_recent_changes(self, limit: int = 10) -> list[StateChange]:
         """Get recent state changes."""
-        return self._change_history[-limit:]
+        # Walk from the newest end so the cost is O(limit), not O(history)
+        recent = list(itertools.islice(reversed(self._change_history), limit))
+        recent.reverse()
+        return recent
 
 
 class StreamMemory:
@@ -189,6 +189,23 @@ def test_cleanup_execution(self):
 
         assert "exec-1" not in manager._execution_state
 
+    @pytest.mark.asyncio
+    async def test_change_history_is_bounded(self):
+        """Test change history keeps only the newest changes, oldest first."""
+        manager = SharedStateManager()
+        memory = manager.create_memory("exec-1", "stream-1", IsolationLevel.ISOLATED)
+
+        for i in range(manager._max_history + 5):
+            await memory.write(f"key{i}", i)
+
+        assert manager.get_stats()["total_changes"] == manager._max_history
+        history = manager.get_recent_changes(limit=manager._max_history)
+        assert history[0].key == "key5"
+        assert [c.new_value for c in manager.get_recent_changes(limit=2)] == [
+            manager._max_history + 3,
+            manager._max_history + 4,
+        ]
+
 
 # === EventBus Tests ===
 
@@ -323,9 +323,11 @@ def filter_and_gate(
         """
         import os
 
-        # Separate project skills from always-trusted scopes
-        always_trusted = [s for s in skills if s.source_scope != "project"]
-        project_skills = [s for s in skills if s.source_scope == "project"]
+        # Separate project skills from always-trusted scopes in one pass
+        always_trusted: list[ParsedSkill] = []
+        project_skills: list[ParsedSkill] = []
+        for s in skills:
+            (project_skills if s.source_scope == "project" else always_trusted).append(s)
 
         if not project_skills:
             return always_trusted
@@ -6,6 +6,7 @@
 """
 
 import asyncio
+import heapq
 import logging
 import uuid
 from datetime import datetime
@@ -166,9 +167,8 @@ def _scan():
                     logger.warning(f"Failed to load {state_path}: {e}")
                     continue
 
-            # Sort by updated_at descending (most recent first)
-            sessions.sort(key=lambda s: s.timestamps.updated_at, reverse=True)
-            return sessions[:limit]
+            # Most recent first; partial sort since only `limit` are returned
+            return heapq.nlargest(limit, sessions, key=lambda s: s.timestamps.updated_at)
 
         return await asyncio.to_thread(_scan)
 
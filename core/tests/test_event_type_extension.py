@@ -976,3 +976,29 @@ async def handler(event):
 
         assert len(received) == 2
         assert all(e.node_id == "my_node" for e in received)
+
+
+class TestEventHistory:
+    """EventBus keeps a bounded, newest-first event history."""
+
+    @pytest.mark.asyncio
+    async def test_history_evicts_oldest_beyond_max(self):
+        bus = EventBus(max_history=3)
+        for i in range(5):
+            await bus.publish(AgentEvent(type=EventType.LLM_TEXT_DELTA, stream_id=f"s{i}"))
+
+        history = bus.get_history(limit=10)
+        assert [e.stream_id for e in history] == ["s4", "s3", "s2"]
+        assert bus.get_stats()["total_events"] == 3
+
+    @pytest.mark.asyncio
+    async def test_history_filters_and_limits_newest_first(self):
+        bus = EventBus()
+        for i in range(4):
+            event_type = EventType.NODE_LOOP_STARTED if i % 2 else EventType.LLM_TEXT_DELTA
+            await bus.publish(AgentEvent(type=event_type, stream_id="s1", execution_id=f"e{i}"))
+
+        latest = bus.get_history(event_type=EventType.NODE_LOOP_STARTED, limit=1)
+        assert [e.execution_id for e in latest] == ["e3"]
+        assert [e.execution_id for e in bus.get_history(execution_id="e0")] == ["e0"]
+        assert bus.get_history(stream_id="other") == []
@@ -246,6 +246,12 @@ async def test_list_runs_limit(self, tmp_path: Path):
 
         runs = await store.list_runs(limit=3)
         assert len(runs) == 3
+        # The limit keeps the most recent runs, newest first
+        assert [r.run_id for r in runs] == [
+            "session_20250101_000009_run0009",
+            "session_20250101_000008_run0008",
+            "session_20250101_000007_run0007",
+        ]
 
     @pytest.mark.asyncio
     async def test_list_runs_includes_in_progress(self, tmp_path: Path):